@@ -1,12 +1,12 @@
 import requests
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
 from datetime import datetime, timezone
 import pyfiglet
 
 ROOT_URL = 'https://pokemondb.net/'
-SESSION = requests.Session()
+ROOT_PREFIX = ROOT_URL.rstrip('/')
 
 HEADERS = {
     "user-agent":"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/93.0.4577.82 Safari/537.36 Edg/93.0.961.52",
@@ -14,25 +14,38 @@ HEADERS = {
     "referer": "https://pokemondb.net/"
 }
 
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+
+POKEDEX_TABLE = SoupStrainer('table', attrs = {'id':'pokedex'})
+
+COLUMNS = [
+    'rank', 'pokemon_name', 'type', 'total_power',
+    'hit_points', 'attack', 'defense', 'special_attack', 'special_defense', 'speed',
+    'icon', 'details_link', 'last_updated_at_UTC'
+]
+
 all_pokemons = []
 
-def extract_content(URL: str) -> str:
+def extract_content(URL: str, session: requests.Session = SESSION) -> str:
     """
     This function takes the Pokedex URL and returns the content that has the required data for scraping
     Args:
         URL (str): The URL string
+        session (requests.Session): The session used to fetch the page, reused so that connections are kept alive
     Returns:
         str: The whole HTML table content for scraping
     """
     
-    response = SESSION.get(URL, headers=HEADERS)
-    soup = BeautifulSoup(response.content, 'html.parser')
-    full_table = soup.find('table', attrs = {'id':'pokedex'})
-    return full_table.find('tbody').find_all('tr')
+    response = session.get(URL)
+    # requests assumes ISO-8859-1 when the header has no charset, so only trust an explicitly declared one
+    page_encoding = response.encoding if 'charset' in response.headers.get('content-type', '') else 'utf-8'
+    full_table = BeautifulSoup(response.content, 'lxml', parse_only=POKEDEX_TABLE, from_encoding=page_encoding)
+    return full_table.find('tbody').find_all('tr', recursive=False)
 
 def scrape_content(content: str) -> None:
     """
-    This function loops through each row of the content extracted from 'extract_content()' function, scrapes the required data and appends it to the 'all_pokemons' list
+    This function loops through each row of the content extracted from 'extract_content()' function, scrapes the required data and appends it to the 'all_pokemons' list as a tuple ordered like 'COLUMNS'
     Args:
         content (str): This is the HTML Table content extracted from 'extract_content()' function
     Returns:
@@ -43,47 +56,36 @@ def scrape_content(content: str) -> None:
     current_utc_timestamp = datetime.now(utc_timezone).strftime('%d-%b-%Y %H:%M:%S')
     
     for pokemon in content:
-        icon = pokemon.find('td', class_ = 'cell-num cell-fixed').find('span', class_='infocard-cell-img').find('span')['data-src']
-        rank = pokemon.find('td', class_ = 'cell-num cell-fixed').find('span', class_ = 'infocard-cell-data').text
-        name = pokemon.find('td', class_= 'cell-name').find('a', class_ = 'ent-name').text
+        num_cell, name_cell, type_cell, total_cell, *power_stats = pokemon.find_all('td', recursive=False)
+        name_link = name_cell.find('a', class_ = 'ent-name')
+        
+        icon = num_cell.find('span', class_='infocard-cell-img').find('span')['data-src']
+        rank = num_cell.find('span', class_ = 'infocard-cell-data').text
+        name = name_link.text
         
-        try:
-            meganame = pokemon.find('td', class_= 'cell-name').find('small', class_='text-muted').text
-            name = name + "-" + meganame
-        except:
-            name = name
+        meganame = name_cell.find('small', class_='text-muted')
+        if meganame is not None:
+            name = name + "-" + meganame.text
         
-        pokemon_partial_url = pokemon.find('td', class_= 'cell-name').find('a', class_ = 'ent-name')['href']
-        pokemon_details_link = urljoin(ROOT_URL, pokemon_partial_url)
+        pokemon_partial_url = name_link['href']
+        if pokemon_partial_url.startswith('/') and not pokemon_partial_url.startswith('//'):
+            pokemon_details_link = ROOT_PREFIX + pokemon_partial_url
+        else:
+            pokemon_details_link = urljoin(ROOT_URL, pokemon_partial_url)
         
-        types = pokemon.find('td', class_='cell-icon').text.strip().replace(' ', ',')
+        types = type_cell.text.strip().replace(' ', ',')
         
-        total_power = pokemon.find('td', class_='cell-total').text
+        total_power = total_cell.text
         
-        hp = pokemon.find_all('td', class_='cell-num')[1].text
-        attack = pokemon.find_all('td', class_='cell-num')[2].text
-        defense = pokemon.find_all('td', class_='cell-num')[3].text
-        sp_attack = pokemon.find_all('td', class_='cell-num')[4].text
-        sp_defense = pokemon.find_all('td', class_='cell-num')[5].text
-        speed = pokemon.find_all('td', class_='cell-num')[6].text
+        hp, attack, defense, sp_attack, sp_defense, speed = (stat.text for stat in power_stats)
         
-        pokemon_dict = {
-            'rank':rank,
-            'pokemon_name': name,
-            'type': types,
-            'total_power': total_power,
-            'hit_points': hp,
-            'attack': attack,
-            'defense': defense,
-            'special_attack': sp_attack,
-            'special_defense': sp_defense,
-            'speed': speed,
-            'icon': icon,
-            'details_link': pokemon_details_link,
-            'last_updated_at_UTC': current_utc_timestamp
-        }
+        pokemon_row = (
+            rank, name, types, total_power,
+            hp, attack, defense, sp_attack, sp_defense, speed,
+            icon, pokemon_details_link, current_utc_timestamp
+        )
         
-        all_pokemons.append(pokemon_dict)
+        all_pokemons.append(pokemon_row)
     return
 
 def load_data() -> None:
@@ -91,7 +93,7 @@ def load_data() -> None:
     This function loads the scraped data into a CSV file
     """
     
-    poke_df = pd.DataFrame(all_pokemons)
+    poke_df = pd.DataFrame(all_pokemons, columns=COLUMNS)
     poke_df.to_csv('pokemons_scraped_data.csv', encoding='utf-8', index=False)
     return
 
@@ -108,7 +110,7 @@ if __name__ == '__main__':
     print(ascii_art_title)
     print('Catching Pokemons...')
     
-    content = extract_content(URL)
+    content = extract_content(URL, SESSION)
     scrape_content(content)
     
     print(f'Total Pokemon Caught: {len(all_pokemons)}')
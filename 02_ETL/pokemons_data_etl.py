@@ -20,7 +20,11 @@ print('\n')
 
 print('Connecting to raw dataset')
 
-scraped_data = pd.read_csv("../01_WEBSCRAPING/pokemons_scraped_data.csv", index_col=False)
+stat_columns = ['rank','hit_points','attack','defense','special_attack','special_defense','speed']
+stat_dtypes = {col: 'int32' for col in stat_columns}
+read_columns = ['pokemon_name','type','icon','details_link'] + stat_columns
+
+scraped_data = pd.read_csv("../01_WEBSCRAPING/pokemons_scraped_data.csv", index_col=False, usecols=read_columns, dtype=stat_dtypes)
 
 print(f'Shape of scraped dataset: {scraped_data.shape}')
 print('\n')
@@ -55,36 +59,38 @@ required_data.columns = new_column_names
 print(f'New column names in the dataframe: {list(required_data.columns)}')
 print('\n')
 
-# -- Transposing Metric Columns --#
+# -- Split "Type" Column into Rows --#
 
-print('Transposing metric columns')
+print('Splitting "Type" column into rows')
 
-id_cols = ['Rank','Pokemon', 'Type', 'Icon', 'Details Link']
-transposed_data = required_data.melt(id_vars=id_cols, var_name="Metric", value_name="Values")
+flat_data = required_data.assign(Type=required_data['Type'].str.split(',')).explode('Type').reset_index(drop=True)
 
-print(f'New column names after transpose: {list(transposed_data.columns)}')
-print(f'Shape of the dataframe after transpose: {transposed_data.shape}')
+print(f'Shape of the dataframe after splitting the "Type" column into rows: {flat_data.shape}')
 print('\n')
 
-# -- Split "Type" Column into Rows --#
+# -- Transposing Metric Columns --#
 
-print('Splitting "Type" column into rows')
+print('Transposing metric columns')
 
-all_other_columns = ['Rank', 'Pokemon', 'Icon', 'Details Link', 'Metric', 'Values']
+category_cols = ['Pokemon', 'Type', 'Icon', 'Details Link']
+flat_data[category_cols] = flat_data[category_cols].astype('category')
 
-flat_data = (transposed_data.set_index(all_other_columns).apply(lambda x: x.str.split(',').explode()).reset_index())
+id_cols = ['Rank','Pokemon', 'Type', 'Icon', 'Details Link']
+transposed_data = flat_data.melt(id_vars=id_cols, var_name="Metric", value_name="Values")
+transposed_data['Metric'] = transposed_data['Metric'].astype('category')
 
-print(f'Shape of the dataframe after splitting the "Type" column into rows: {flat_data.shape}')
+print(f'New column names after transpose: {list(transposed_data.columns)}')
+print(f'Shape of the dataframe after transpose: {transposed_data.shape}')
 print('\n')
 
 # -- Rearranging Columns -- #
 
 print('Rearranging columns')
-print(f'Existing column arrangement: {list(flat_data.columns)}')
+print(f'Existing column arrangement: {list(transposed_data.columns)}')
 
 rearranged_columns = ['Rank','Type', 'Pokemon', 'Icon', 'Details Link', 'Metric', 'Values']
 
-pokedex_data = flat_data.reindex(columns=rearranged_columns)
+pokedex_data = transposed_data.reindex(columns=rearranged_columns)
 
 print(f'New column arrangement: {list(pokedex_data.columns)}')
 print('\n')
@@ -93,10 +99,9 @@ print('\n')
 
 print('Adding custom index column to the dataframe')
 
-custom_index_col = pd.RangeIndex(start=1000, stop=1000+len(pokedex_data), step=1, name='PokeID')
+custom_index_col = [f'P{poke_id}-{rank}' for poke_id, rank in zip(range(1000, 1000+len(pokedex_data)), pokedex_data["Rank"])]
 
-pokedex_data.index = custom_index_col
-pokedex_data.index = 'P' + pokedex_data.index.astype('string') + '-' + pokedex_data["Rank"].astype('string')
+pokedex_data.index = pd.Index(custom_index_col, name='PokeID')
 
 print(f'Is the index column unique: {pokedex_data.index.is_unique}')
 print(f'Snippet of the transformed dataframe:')